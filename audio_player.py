@@ -19,38 +19,231 @@ Features:
 """
 
 import os
+import io
 import sys
 import time
 import json
+import multiprocessing
+import struct
+import bisect
+import random
+import hashlib
+import functools
+import sqlite3
 import threading
 import traceback
 import wave
 import pygame
-import mutagen
 from pygame import mixer
-from mutagen.id3 import ID3
-from mutagen.flac import FLAC
-from mutagen.oggvorbis import OggVorbis
 from typing import List, Dict, Optional, Tuple, Union
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 from PIL import Image, ImageTk, ImageDraw
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from collections import deque
 import platform
-import pystray
-from pystray import MenuItem as item
 import webbrowser
 
+try:
+    # pytaglib parses in native code, so tag pool workers spend far less time holding the GIL
+    import taglib
+except ImportError:
+    taglib = None
+
 # Constants
+APP_VERSION = '1.0.0'
 SUPPORTED_FORMATS = ('.mp3', '.wav', '.flac', '.ogg', '.m4a')
+SUPPORTED_EXTS = frozenset(SUPPORTED_FORMATS)  # O(1) membership for folder scans
 DEFAULT_VOLUME = 0.7
 VISUALIZATION_SAMPLES = 120
 HISTORY_SIZE = 20
 CONFIG_FILE = 'audio_player_config.json'
+TAG_CACHE_FILE = 'audio_player_tagcache.sqlite'
+UPDATE_CHECK_FILE = 'audio_player_update.json'
+UPDATE_CHECK_INTERVAL = 24 * 60 * 60  # seconds
+TAG_CACHE_FLUSH_SIZE = 50
+ART_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'audio_player', 'art')
+ART_SIZE = (60, 60)
+COVER_FILES = ('cover.jpg', 'folder.jpg', 'Folder.jpg', 'cover.png')  # sidecar art next to the tracks
+FOLDER_SCAN_BATCH = 256
+FOLDER_SCAN_INTERVAL = 0.1  # seconds between playlist updates while scanning
+SCAN_PROCESS_THRESHOLD = 128  # batches this large parse uncached files in worker processes
+SCAN_CHUNK_SIZE = 32
+TAG_WORKERS = min(16, (os.cpu_count() or 1) * 2)  # enough to overlap seeks on an SSD; ~2 suits a spinning disk
+
+# Theme colors keyed by dark_mode
+THEMES = {
+    True: {
+        'bg': '#2d2d2d',
+        'fg': '#ffffff',
+        'entry_bg': '#3d3d3d',
+        'highlight': '#4d4d4d',
+        'canvas_bg': 'black',
+    },
+    False: {
+        'bg': '#f0f0f0',
+        'fg': '#000000',
+        'entry_bg': '#ffffff',
+        'highlight': '#d4d4d4',
+        'canvas_bg': 'white',
+    },
+}
+
+# Tag parsing is dominated by file reads, so it parallelizes well across threads
+_tag_pool = ThreadPoolExecutor(max_workers=TAG_WORKERS, thread_name_prefix='tags')
+
+# Now playing and on-screen rows get their own threads so bulk imports never queue ahead of them
+_priority_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='tags-priority')
+
+# Created on the first large scan; pure-Python parsing of thousands of files is CPU bound
+_scan_pool: Optional[ProcessPoolExecutor] = None
+
+def _get_scan_pool():
+    """Return the process pool used for large library scans (call from the Tk thread)"""
+    global _scan_pool
+    if _scan_pool is None:
+        # Spawn, not fork: a child forked while tag threads import mutagen can inherit a held import lock
+        # (Windows also rejects more than 61 workers)
+        _scan_pool = ProcessPoolExecutor(
+            max_workers=min(61, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+    return _scan_pool
+
+def _is_audio_name(name):
+    """Return True if a file name has a supported extension (dotfiles like '.mp3' have none)"""
+    return os.path.splitext(name)[1].lower() in SUPPORTED_EXTS
 
-@dataclass
+def _iter_audio(root):
+    """Yield supported audio files under root as they are found"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+        
+    with entries:
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+                
+            if is_dir:
+                yield from _iter_audio(entry.path)
+            else:
+                # A set lookup beats a tuple endswith scan
+                if not _is_audio_name(entry.name):
+                    continue
+                    
+                # Follow symlinks here so linked tracks are kept but broken links are not
+                try:
+                    is_file = entry.is_file()
+                except OSError:
+                    continue
+                    
+                if is_file:
+                    yield entry.path
+
+def _wav_length(path):
+    """Return a WAV file's duration from its canonical 44-byte header, or None if the layout differs"""
+    with open(path, 'rb') as f:
+        header = f.read(44)
+        
+    if (len(header) < 44 or header[0:4] != b'RIFF' or header[8:12] != b'WAVE'
+            or header[12:16] != b'fmt ' or header[36:40] != b'data'
+            or struct.unpack('<I', header[16:20])[0] != 16):
+        return None
+        
+    byte_rate = struct.unpack('<I', header[28:32])[0]
+    if not byte_rate:
+        return None
+        
+    # Streaming writers leave the data size at 0 or 0xFFFFFFFF, so never trust it past the file size
+    data_size = struct.unpack('<I', header[40:44])[0]
+    available = os.path.getsize(path) - 44
+    if not data_size or data_size > available:
+        data_size = available
+    return data_size / byte_rate
+
+# Bar color for each whole visualization level 0-100, as RGB rows
+_VIS_COLOR_LUT = np.array(
+    [(int(255 * v / 100), int(128 + v / 100 * 127), 128) for v in range(101)],
+    dtype=np.uint8
+)
+
+@functools.lru_cache(maxsize=8192)
+def _format_time_s(total_seconds):
+    """Format whole seconds as M:SS (memoized; the progress loop repeats the same values)"""
+    return f"{total_seconds // 60}:{total_seconds % 60:02d}"
+
+class TagCache:
+    """Persistent tag cache keyed by path and invalidated by (mtime, size)"""
+    
+    def __init__(self, db_path=TAG_CACHE_FILE):
+        self.entries: Dict[str, tuple] = {}
+        self._dirty: List[tuple] = []
+        self._lock = threading.Lock()
+        self._conn = None
+        
+        try:
+            # Workers store rows from the tag thread pool, so the connection is shared across threads
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS tags ('
+                'path TEXT PRIMARY KEY, mtime REAL, size INTEGER, '
+                'title TEXT, artist TEXT, album TEXT, length REAL)'
+            )
+            for path, *row in self._conn.execute('SELECT path, mtime, size, title, artist, album, length FROM tags'):
+                self.entries[path] = tuple(row)
+        except sqlite3.Error as e:
+            print(f"Error loading tag cache: {e}")
+            self._conn = None
+    
+    def get(self, path, mtime, size):
+        """Return (title, artist, album, length) if the cached entry is still valid"""
+        row = self.entries.get(path)
+        if row is not None and row[0] == mtime and row[1] == size:
+            return row[2:]
+        return None
+    
+    def put(self, path, mtime, size, title, artist, album, length):
+        """Store parsed tags, writing them out in batches"""
+        row = (mtime, size, title, artist, album, length)
+        with self._lock:
+            self.entries[path] = row
+            self._dirty.append((path,) + row)
+            if len(self._dirty) >= TAG_CACHE_FLUSH_SIZE:
+                self._flush()
+    
+    def flush(self):
+        """Write pending entries to disk"""
+        with self._lock:
+            self._flush()
+    
+    def close(self):
+        """Flush pending entries and close the database"""
+        with self._lock:
+            self._flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
+    def _flush(self):
+        if not self._dirty or self._conn is None:
+            return
+            
+        try:
+            with self._conn:
+                self._conn.executemany('INSERT OR REPLACE INTO tags VALUES (?, ?, ?, ?, ?, ?, ?)', self._dirty)
+        except sqlite3.Error as e:
+            print(f"Error saving tag cache: {e}")
+        self._dirty.clear()
+
+
+@dataclass(slots=True)
 class Song:
     path: str
     title: str
@@ -58,35 +251,85 @@ class Song:
     album: str
     length: float
     tags_loaded: bool = False
+    _art_photo: Optional[object] = field(default=None, repr=False, compare=False)  # album art PhotoImage, set on first display
 
-    def load_tags(self):
+    def load_tags(self, cache: Optional[TagCache] = None):
+        """Read title, artist, album and length from the file (safe to call from a worker thread)"""
         if self.tags_loaded:
             return
             
         try:
-            if self.path.lower().endswith('.mp3'):
-                audio = ID3(self.path)
-                self.title = audio.get('TIT2', [self.title])[0]
-                self.artist = audio.get('TPE1', [self.artist])[0]
-                self.album = audio.get('TALB', [self.album])[0]
-            elif self.path.lower().endswith('.flac'):
-                audio = FLAC(self.path)
-                self.title = audio.get('title', [self.title])[0]
-                self.artist = audio.get('artist', [self.artist])[0]
-                self.album = audio.get('album', [self.album])[0]
-            elif self.path.lower().endswith('.ogg'):
-                audio = OggVorbis(self.path)
+            stat = os.stat(self.path)
+        except OSError:
+            stat = None
+            
+        if cache is not None and stat is not None:
+            cached = cache.get(self.path, stat.st_mtime, stat.st_size)
+            if cached is not None:
+                self.apply_tags(*cached)
+                return
+                
+        # Failed reads (permissions, a file still being copied) are not cached, so they are retried next time
+        if self.read_tags() and cache is not None and stat is not None:
+            cache.put(self.path, stat.st_mtime, stat.st_size, self.title, self.artist, self.album, self.length)
+            
+        self.intern_tags()
+        self.tags_loaded = True
+    
+    def read_tags(self):
+        """Parse the file's tags into the fields, returning False if the file could not be read"""
+        try:
+            if taglib is not None:
+                audio = taglib.File(self.path)
+                try:
+                    self.length = audio.length
+                    self.title = audio.tags.get('TITLE', [self.title])[0]
+                    self.artist = audio.tags.get('ARTIST', [self.artist])[0]
+                    self.album = audio.tags.get('ALBUM', [self.album])[0]
+                finally:
+                    audio.close()
+            elif self.path.lower().endswith('.wav'):
+                length = _wav_length(self.path)
+                if length is None:
+                    # Extra chunks before the data (LIST, fact, ...) need the full chunk walk
+                    with wave.open(self.path, 'rb') as wav_file:
+                        length = wav_file.getnframes() / float(wav_file.getframerate())
+                self.length = length
+            else:
+                # Easy mode reads only the text tags, leaving embedded pictures for load_album_art
+                import mutagen
+                audio = mutagen.File(self.path, easy=True)
+                if audio is None:
+                    return False
+                self.length = audio.info.length
                 self.title = audio.get('title', [self.title])[0]
                 self.artist = audio.get('artist', [self.artist])[0]
                 self.album = audio.get('album', [self.album])[0]
-            else:
-                # For WAV and other formats without standard tagging
-                pass
         except Exception:
             # Fall back to filename if metadata reading fails
-            pass
-            
+            return False
+        return True
+    
+    def apply_tags(self, title, artist, album, length):
+        """Set tags read elsewhere (the tag cache or a scan worker process)"""
+        self.title, self.artist, self.album, self.length = title, artist, album, length
+        self.intern_tags()
         self.tags_loaded = True
+    
+    def intern_tags(self):
+        """Share artist/album strings between songs, since large libraries repeat them heavily"""
+        self.artist = sys.intern(self.artist)
+        self.album = sys.intern(self.album)
+
+def _scan_one(path):
+    """Read one file's tags in a scan worker process"""
+    song = Song(path=path, title=os.path.basename(path), artist='Unknown Artist', album='Unknown Album', length=0.0)
+    parsed = song.read_tags()
+    return (path, song.title, song.artist, song.album, song.length, parsed)
+
+def _scan_chunk(paths):
+    """Read a chunk of files' tags in a scan worker process"""
+    return [_scan_one(path) for path in paths]
 
 class AudioPlayerApp:
     def __init__(self, root):
@@ -100,6 +343,8 @@ class AudioPlayerApp:
         
         # Player state
         self.playlist: List[Song] = []
+        self._iids: List[str] = []  # Treeview item IDs in playlist order
+        self._iid_to_idx: Dict[str, int] = {}
         self.current_index: int = -1
         self.paused: bool = False
         self.volume: float = DEFAULT_VOLUME
@@ -107,15 +352,41 @@ class AudioPlayerApp:
         self.playback_speed = 1.0
         self.repeat_mode = 0  # 0: off, 1: single, 2: all
         self.shuffle_mode = False
+        self._shuffle_order: List[int] = []  # cleared whenever the playlist changes
+        self._shuffle_pos = 0
         self.play_history = deque(maxlen=HISTORY_SIZE)
-        self.visualization_data = deque([0] * VISUALIZATION_SAMPLES, maxlen=VISUALIZATION_SAMPLES)
+        self._viz_buf = np.zeros(VISUALIZATION_SAMPLES, dtype=np.float32)  # ring buffer, oldest at _viz_head
+        self._viz_head = 0
+        self._viz_noise = np.random.rand(VISUALIZATION_SAMPLES).astype(np.float32) * 100  # consumed one sample per tick
+        self._viz_noise_pos = 0
+        self._viz_layout_size = None
+        self._viz_layout = None
+        self._viz_frame = None
+        self._vis_active = True  # False while the main window is hidden in the tray
         self.dark_mode = False
+        self._applied_theme = None
+        
+        # Background tag loading for rows scrolled into view
+        self.tag_cache = TagCache()
+        self._tags_pending = set()  # songs with their own task on the tag pool
+        self._tags_urgent = set()  # songs with a task on the priority pool
+        self._tags_batched = set()  # songs queued in a process-pool batch, which may take a while to reach them
+        self._playlist_generation = 0  # bumped by clear_playlist so queued tag work for old songs is dropped
+        self._scan_futures = set()
+        self._visible_tags_job = None
+        self._progress_job = None
+        self._volume_job = None
+        self._seek_job = None
+        self._setting_progress = False  # True while the code, not the user, moves the seek bar
+        self._folder_scan_id = 0
         
         # Load config
         self.load_config()
+        self.update_equalizer_gains()
         
         # Setup UI
         self.setup_ui()
+        self._no_art_photo = self.build_no_art_photo()  # shared by every song without album art
         
         # Setup system tray
         self.setup_system_tray()
@@ -123,19 +394,24 @@ class AudioPlayerApp:
         # Bind keyboard shortcuts
         self.setup_keyboard_shortcuts()
         
-        # Start visualization update thread
-        self.visualization_thread_running = True
-        self.visualization_thread = threading.Thread(target=self.update_visualization, daemon=True)
-        self.visualization_thread.start()
+        # Listen for the mixer's end-of-song event
+        self.root.after(50, self.pump_events)
+        
+        # Animate the visualization from the Tk event loop
+        self.root.after(50, self.visualization_tick)
         
         # Check for updates periodically
-        self.check_for_updates()
+        self.check_for_updates(force=False)
         
     def initialize_audio(self):
         """Initialize pygame mixer with optimal settings"""
         try:
             pygame.init()
             mixer.init(frequency=44100, size=-16, channels=2, buffer=4096)
+            
+            # Posted by the mixer when a song finishes, replacing end-of-song polling
+            self.END_EVENT = pygame.USEREVENT + 1
+            mixer.music.set_endevent(self.END_EVENT)
         except Exception as e:
             messagebox.showerror("Audio Error", f"Failed to initialize audio: {str(e)}")
             sys.exit(1)
@@ -257,15 +533,19 @@ class AudioPlayerApp:
         self.playlist_tree.heading('duration', text='Time', anchor=tk.E)
         
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(self.left_panel, orient=tk.VERTICAL, command=self.playlist_tree.yview)
-        self.playlist_tree.configure(yscrollcommand=scrollbar.set)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.playlist_scrollbar = ttk.Scrollbar(self.left_panel, orient=tk.VERTICAL, command=self.playlist_tree.yview)
+        self.playlist_tree.configure(yscrollcommand=self.on_playlist_scroll)
+        self.playlist_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.playlist_tree.pack(fill=tk.BOTH, expand=True)
         
         # Bind double click to play selected song
         self.playlist_tree.bind('<Double-1>', lambda e: self.play_selected())
         self.playlist_tree.bind('<Return>', lambda e: self.play_selected())
         
+        # Load tags for rows as they become visible or selected
+        self.playlist_tree.bind('<<TreeviewSelect>>', lambda e: self.schedule_visible_tags())
+        self.playlist_tree.bind('<Configure>', lambda e: self.schedule_visible_tags())
+        
         # Context menu
         self.playlist_menu = tk.Menu(self.root, tearoff=0)
         self.playlist_menu.add_command(label="Play", command=self.play_selected)
@@ -371,8 +651,13 @@ class AudioPlayerApp:
         )
         self.visualization_canvas.pack(fill=tk.BOTH, expand=True)
         
-        # Start with a simple visualization
-        self.draw_visualization()
+        # Each frame is blitted into a single image item instead of one rectangle per bar
+        self.visualization_photo = None
+        self.visualization_image = self.visualization_canvas.create_image(0, 0, anchor=tk.NW)
+        
+        self.visualization_size = (1, 1)
+        self.visualization_canvas.bind('<Configure>', self.on_visualization_resize)
+        self.update_visualization_background()
     
     def create_equalizer(self):
         """Create the equalizer UI (initially hidden)"""
@@ -399,6 +684,7 @@ class AudioPlayerApp:
                 to=12,
                 orient=tk.VERTICAL,
                 command=lambda v, idx=i: self.on_equalizer_change(idx, float(v))
+            )
             slider.set(0)
             slider.pack(fill=tk.Y, expand=True)
             self.eq_sliders.append(slider)
@@ -423,6 +709,10 @@ class AudioPlayerApp:
             return
             
         try:
+            # Imported here so startup (and Linux, which never gets a tray) skips loading it
+            import pystray
+            from pystray import MenuItem as item
+            
             image = Image.new('RGB', (64, 64), 'black')
             draw = ImageDraw.Draw(image)
             draw.ellipse((16, 16, 48, 48), fill='white')
@@ -459,50 +749,29 @@ class AudioPlayerApp:
     
     def apply_theme(self):
         """Apply the current theme (light/dark)"""
-        if self.dark_mode:
-            bg_color = '#2d2d2d'
-            fg_color = '#ffffff'
-            entry_bg = '#3d3d3d'
-            highlight_color = '#4d4d4d'
+        theme = THEMES[self.dark_mode]
+        if self._applied_theme is theme:
+            return  # Every style is already set for this theme
             
-            style = ttk.Style()
+        style = ttk.Style()
+        if self._applied_theme is None:
             style.theme_use('clam')
             
-            style.configure('.', background=bg_color, foreground=fg_color)
-            style.configure('TFrame', background=bg_color)
-            style.configure('TLabel', background=bg_color, foreground=fg_color)
-            style.configure('TButton', background=bg_color, foreground=fg_color)
-            style.configure('TEntry', fieldbackground=entry_bg, foreground=fg_color)
-            style.configure('TScale', background=bg_color)
-            style.configure('Treeview', 
-                          background=entry_bg, 
-                          foreground=fg_color,
-                          fieldbackground=entry_bg)
-            style.map('Treeview', background=[('selected', highlight_color)])
-            
-            self.visualization_canvas.config(bg='black')
-        else:
-            bg_color = '#f0f0f0'
-            fg_color = '#000000'
-            entry_bg = '#ffffff'
-            highlight_color = '#d4d4d4'
-            
-            style = ttk.Style()
-            style.theme_use('clam')
-            
-            style.configure('.', background=bg_color, foreground=fg_color)
-            style.configure('TFrame', background=bg_color)
-            style.configure('TLabel', background=bg_color, foreground=fg_color)
-            style.configure('TButton', background=bg_color, foreground=fg_color)
-            style.configure('TEntry', fieldbackground=entry_bg, foreground=fg_color)
-            style.configure('TScale', background=bg_color)
-            style.configure('Treeview', 
-                          background=entry_bg, 
-                          foreground=fg_color,
-                          fieldbackground=entry_bg)
-            style.map('Treeview', background=[('selected', highlight_color)])
-            
-            self.visualization_canvas.config(bg='white')
+        style.configure('.', background=theme['bg'], foreground=theme['fg'])
+        style.configure('TFrame', background=theme['bg'])
+        style.configure('TLabel', background=theme['bg'], foreground=theme['fg'])
+        style.configure('TButton', background=theme['bg'], foreground=theme['fg'])
+        style.configure('TEntry', fieldbackground=theme['entry_bg'], foreground=theme['fg'])
+        style.configure('TScale', background=theme['bg'])
+        style.configure('Treeview', 
+                      background=theme['entry_bg'], 
+                      foreground=theme['fg'],
+                      fieldbackground=theme['entry_bg'])
+        style.map('Treeview', background=[('selected', theme['highlight'])])
+        
+        self.visualization_canvas.config(bg=theme['canvas_bg'])
+        self.update_visualization_background()
+        self._applied_theme = theme
     
     # Player functionality
     def play(self, index=None):
@@ -511,7 +780,7 @@ class AudioPlayerApp:
             selection = self.playlist_tree.selection()
             if not selection:
                 return
-            index = self.playlist_tree.index(selection[0])
+            index = self._iid_to_idx[selection[0]]
         
         if index < 0 or index >= len(self.playlist):
             return
@@ -520,7 +789,7 @@ class AudioPlayerApp:
         song = self.playlist[index]
         
         try:
-            mixer.music.stop()
+            self.halt_music()
             mixer.music.unload()
             
             # Load the new song
@@ -536,9 +805,10 @@ class AudioPlayerApp:
             self.update_play_button()
             
             # Update UI
-            self.playlist_tree.selection_set(self.playlist_tree.get_children()[index])
-            self.playlist_tree.see(self.playlist_tree.get_children()[index])
-            self.update_now_playing(song)
+            iid = self._iids[index]
+            self.playlist_tree.selection_set(iid)
+            self.playlist_tree.see(iid)
+            self.update_now_playing(song, iid)
             self.update_progress()
             
             # Add to history
@@ -552,7 +822,7 @@ class AudioPlayerApp:
         """Play the currently selected song"""
         selection = self.playlist_tree.selection()
         if selection:
-            self.play(self.playlist_tree.index(selection[0]))
+            self.play(self._iid_to_idx[selection[0]])
     
     def toggle_play_pause(self):
         """Toggle between play and pause"""
@@ -575,10 +845,10 @@ class AudioPlayerApp:
     
     def stop(self):
         """Stop playback"""
-        mixer.music.stop()
+        self.halt_music()
         self.paused = False
         self.update_play_button()
-        self.progress.set(0)
+        self.set_progress(0)
         self.time_elapsed.config(text="0:00")
     
     def next_track(self):
@@ -627,22 +897,32 @@ class AudioPlayerApp:
         if not self.playlist:
             return
             
-        if len(self.playlist) == 1:
-            self.play(0)
-            return
-            
-        import random
-        next_index = random.randint(0, len(self.playlist) - 1)
-        while next_index == self.current_index and len(self.playlist) > 1:
-            next_index = random.randint(0, len(self.playlist) - 1)
+        if len(self._shuffle_order) != len(self.playlist):
+            self.reshuffle()
             
-        self.play(next_index)
+        # Walk the shuffled order so every track plays once before any repeats
+        self._shuffle_pos = (self._shuffle_pos + 1) % len(self._shuffle_order)
+        self.play(self._shuffle_order[self._shuffle_pos])
+    
+    def reshuffle(self):
+        """Build a new shuffled play order starting from the current song"""
+        self._shuffle_order = random.sample(range(len(self.playlist)), len(self.playlist))
+        self._shuffle_pos = 0
+        
+        if 0 <= self.current_index < len(self.playlist):
+            pos = self._shuffle_order.index(self.current_index)
+            self._shuffle_order[0], self._shuffle_order[pos] = self._shuffle_order[pos], self._shuffle_order[0]
     
     def set_volume(self, volume):
         """Set the volume (0.0 to 1.0)"""
+        self.apply_volume(volume)
+        self.vol_slider.set(self.volume * 100)
+    
+    def apply_volume(self, volume):
+        """Send the volume to the mixer and update the mute button"""
+        self._volume_job = None
         self.volume = max(0.0, min(1.0, volume))
         mixer.music.set_volume(self.volume)
-        self.vol_slider.set(self.volume * 100)
         
         # Update mute button appearance
         if self.volume <= 0:
@@ -659,8 +939,16 @@ class AudioPlayerApp:
             self.set_volume(self.last_volume if hasattr(self, 'last_volume') else DEFAULT_VOLUME)
     
     def on_volume_change(self, value):
-        """Handle volume slider change"""
-        self.set_volume(float(value) / 100)
+        """Handle volume slider change, applying it once the slider settles"""
+        if self._volume_job is not None:
+            self.root.after_cancel(self._volume_job)
+            self._volume_job = None
+            
+        volume = float(value) / 100
+        if abs(volume - self.volume) < 1e-6:
+            return  # Echo of set_volume moving the slider
+            
+        self._volume_job = self.root.after(50, self.apply_volume, volume)
     
     def set_repeat_mode(self, mode):
         """Set repeat mode (0: off, 1: single, 2: all)"""
@@ -674,6 +962,8 @@ class AudioPlayerApp:
     def toggle_shuffle(self):
         """Toggle shuffle mode"""
         self.shuffle_mode = not self.shuffle_mode
+        if self.shuffle_mode:
+            self.reshuffle()
         self.update_shuffle_button()
     
     def set_playback_speed(self):
@@ -689,18 +979,37 @@ class AudioPlayerApp:
         if speed is not None:
             self.playback_speed = speed
             if mixer.music.get_busy():
-                mixer.music.set_endevent()  # Clear any existing end event
                 current_pos = mixer.music.get_pos() / 1000  # Get position in seconds
-                mixer.music.stop()
+                self.halt_music()
                 mixer.music.load(self.playlist[self.current_index].path)
                 mixer.music.play(start=current_pos / self.playback_speed)
                 mixer.music.set_volume(self.volume)
     
+    def set_progress(self, percent):
+        """Move the seek bar without it being handled as a user seek"""
+        self._setting_progress = True
+        try:
+            self.progress.set(percent)
+        finally:
+            self._setting_progress = False
+    
     def on_seek(self, value):
-        """Handle seek bar movement (during drag)"""
-        if not hasattr(self, 'last_seek_update') or time.time() - self.last_seek_update > 0.1:
-            self.last_seek_update = time.time()
-            self.time_elapsed.config(text=self.format_time(float(value)))
+        """Handle seek bar movement (during drag), updating the time once the bar settles"""
+        if self._setting_progress:
+            return  # Echo of set_progress, since ttk.Scale.set runs -command
+            
+        if self._seek_job is not None:
+            self.root.after_cancel(self._seek_job)
+        self._seek_job = self.root.after(50, self.show_seek_time, float(value))
+    
+    def show_seek_time(self, percent):
+        """Show the time at the seek bar position"""
+        self._seek_job = None
+        if not 0 <= self.current_index < len(self.playlist):
+            return
+            
+        song_length = self.playlist[self.current_index].length
+        self.time_elapsed.config(text=self.format_time(percent / 100 * song_length))
     
     def on_seek_release(self, event):
         """Handle seek bar release (seek to position)"""
@@ -714,10 +1023,33 @@ class AudioPlayerApp:
             new_pos = seek_pos / 100 * song_length
             mixer.music.set_pos(new_pos)
     
+    def halt_music(self):
+        """Stop the mixer without the stop being reported as the song ending"""
+        mixer.music.stop()
+        pygame.event.clear(self.END_EVENT)
+    
+    def pump_events(self):
+        """Dispatch pending mixer events"""
+        for event in pygame.event.get(self.END_EVENT):
+            self.on_song_end()
+            
+        self.root.after(50, self.pump_events)
+    
+    def on_song_end(self):
+        """Handle the mixer finishing the current song"""
+        if self.repeat_mode == 1:  # Repeat single
+            self.play(self.current_index)
+        else:
+            self.next_track()
+    
     def update_progress(self):
         """Update the progress bar and time display"""
+        # play() restarts the loop, so drop any update already scheduled
+        if self._progress_job is not None:
+            self.root.after_cancel(self._progress_job)
+            
         if self.current_index == -1 or not self.playlist:
-            self.root.after(1000, self.update_progress)
+            self._progress_job = self.root.after(1000, self.update_progress)
             return
             
         if mixer.music.get_busy() and not self.paused:
@@ -726,83 +1058,136 @@ class AudioPlayerApp:
             
             if song_length > 0:
                 progress_percent = (current_pos / song_length) * 100
-                self.progress.set(progress_percent)
+                self.set_progress(progress_percent)
                 self.time_elapsed.config(text=self.format_time(current_pos))
                 
-                # Check if song ended (with some buffer for lag)
-                if current_pos >= song_length - 0.5:
-                    if self.repeat_mode == 1:  # Repeat single
-                        self.play(self.current_index)
-                    else:
-                        self.next_track()
-        
-        self.root.after(200, self.update_progress)
+            self._progress_job = self.root.after(200, self.update_progress)
+        else:
+            # Nothing moves while paused or stopped
+            self._progress_job = self.root.after(500, self.update_progress)
     
     def format_time(self, seconds):
         """Format seconds into MM:SS"""
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes}:{seconds:02d}"
+        return _format_time_s(int(seconds))
     
-    def update_now_playing(self, song):
+    def update_now_playing(self, song, iid):
         """Update the now playing information"""
-        song.load_tags()
+        self.show_song_info(song)
+        
+        # Show what's known now; on_tags_loaded refreshes the labels once the tags are read
+        if not song.tags_loaded:
+            self.load_tags_async([(iid, song)], urgent=True)
         
+        # Try to load album art
+        self.load_album_art(song)
+    
+    def show_song_info(self, song):
+        """Show a song's metadata in the now playing panel"""
         self.song_title.config(text=song.title or os.path.basename(song.path))
         self.song_artist.config(text=song.artist or "Unknown Artist")
         self.song_album.config(text=song.album or "Unknown Album")
         
         self.time_total.config(text=self.format_time(song.length))
-        
-        # Try to load album art
-        self.load_album_art(song)
     
     def load_album_art(self, song):
         """Try to load album art for the current song"""
-        # Clear current image
-        self.album_art.config(image='')
-        self.album_art.image = None
+        if song._art_photo is not None:
+            self.album_art.config(image=song._art_photo)
+            self.album_art.image = song._art_photo
+            return
+            
+        photo = self.album_thumbnail(song.path)
         
-        # Try to extract image from tags
+        if photo is None:
+            # Use default image if no album art found
+            photo = self._no_art_photo
+            
+        self.album_art.config(image=photo)
+        self.album_art.image = photo
+        song._art_photo = photo
+    
+    def build_no_art_photo(self):
+        """Draw the "No Image" album art placeholder"""
+        img = Image.new('RGB', ART_SIZE, 'black')
+        draw = ImageDraw.Draw(img)
+        draw.text((10, 20), "No Image", fill='white')
+        return ImageTk.PhotoImage(img)
+    
+    def album_thumbnail(self, song_path):
+        """Return the song's album art as a PhotoImage, or None if it has none
+        
+        Thumbnails are cached as PNGs under ART_CACHE_DIR at the size the label
+        displays, keyed by path, mtime and size so edited files are re-extracted.
+        """
         try:
-            if song.path.lower().endswith('.mp3'):
-                audio = ID3(song.path)
-                for tag in audio.values():
-                    if tag.FrameID == 'APIC':
-                        img_data = tag.data
-                        break
-                else:
-                    raise ValueError("No image found")
-            elif song.path.lower().endswith('.flac'):
-                audio = FLAC(song.path)
-                if not audio.pictures:
-                    raise ValueError("No image found")
-                img_data = audio.pictures[0].data
-            elif song.path.lower().endswith('.ogg'):
-                audio = OggVorbis(song.path)
-                if not audio.pictures:
-                    raise ValueError("No image found")
-                img_data = audio.pictures[0].data
-            else:
-                raise ValueError("Unsupported format for album art")
+            stat = os.stat(song_path)
+        except OSError:
+            return None
             
-            # Create image from data
+        key = hashlib.sha1(f"{song_path}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')).hexdigest()
+        cache_path = os.path.join(ART_CACHE_DIR, key + '.png')
+        
+        try:
+            if os.path.isfile(cache_path):
+                with Image.open(cache_path) as img:
+                    return ImageTk.PhotoImage(img)
+                    
+            try:
+                img_data = self.extract_album_art(song_path)
+            except Exception:
+                img_data = self.read_cover_file(song_path)
+                if img_data is None:
+                    return None
+                    
             img = Image.open(io.BytesIO(img_data))
-            img.thumbnail((60, 60))
-            photo = ImageTk.PhotoImage(img)
-            
-            self.album_art.config(image=photo)
-            self.album_art.image = photo
+            if img.format == 'JPEG':
+                # Let libjpeg decode at a reduced DCT scale instead of full resolution
+                img.draft('RGB', ART_SIZE)
+            img.thumbnail(ART_SIZE, Image.Resampling.BICUBIC, reducing_gap=2.0)
+            if img.mode not in ('RGB', 'RGBA'):
+                img = img.convert('RGB')
+        except Exception:
+            return None
             
-        except Exception as e:
-            # Use default image if no album art found
-            img = Image.new('RGB', (60, 60), 'black')
-            draw = ImageDraw.Draw(img)
-            draw.text((10, 20), "No Image", fill='white')
-            photo = ImageTk.PhotoImage(img)
+        try:
+            os.makedirs(ART_CACHE_DIR, exist_ok=True)
+            img.save(cache_path, 'PNG')
+        except OSError as e:
+            print(f"Error caching album art: {e}")
             
-            self.album_art.config(image=photo)
-            self.album_art.image = photo
+        return ImageTk.PhotoImage(img)
+    
+    def extract_album_art(self, song_path):
+        """Return the raw embedded album art bytes for a song"""
+        if song_path.lower().endswith('.mp3'):
+            from mutagen.id3 import ID3
+            frames = ID3(song_path).getall('APIC')
+            if not frames:
+                raise ValueError("No image found")
+            return frames[0].data
+        elif song_path.lower().endswith('.flac'):
+            from mutagen.flac import FLAC
+            audio = FLAC(song_path)
+            if not audio.pictures:
+                raise ValueError("No image found")
+            return audio.pictures[0].data
+        elif song_path.lower().endswith('.ogg'):
+            from mutagen.oggvorbis import OggVorbis
+            audio = OggVorbis(song_path)
+            if not audio.pictures:
+                raise ValueError("No image found")
+            return audio.pictures[0].data
+        else:
+            raise ValueError("Unsupported format for album art")
+    
+    def read_cover_file(self, song_path):
+        """Return the bytes of a cover image in the song's folder, or None if there is none"""
+        folder = Path(song_path).parent
+        for name in COVER_FILES:
+            cover = folder / name
+            if cover.is_file():
+                return cover.read_bytes()
+        return None
     
     def update_play_button(self):
         """Update the play/pause button appearance"""
@@ -870,80 +1255,249 @@ class AudioPlayerApp:
         
         if folder:
             self.clear_playlist()
-            files = []
+            self.status_left.config(text=f"Scanning {os.path.basename(folder)}...")
+            threading.Thread(target=self.scan_folder, args=(folder, self._folder_scan_id), daemon=True).start()
+    
+    def scan_folder(self, folder, scan_id):
+        """Walk a folder on a worker thread, feeding files to the playlist as they are found"""
+        batch = []
+        added = 0
+        last_flush = time.monotonic()
+        
+        for path in _iter_audio(folder):
+            if scan_id != self._folder_scan_id:
+                return  # Playlist was replaced while scanning
+                
+            batch.append(path)
+            
+            # Hand over the first file straight away so playback can start, then batch the rest
+            if not added or len(batch) >= FOLDER_SCAN_BATCH or time.monotonic() - last_flush >= FOLDER_SCAN_INTERVAL:
+                self.root.after(0, self.add_scanned_files, batch, scan_id)
+                added += len(batch)
+                batch = []
+                last_flush = time.monotonic()
+                
+        self.root.after(0, self.finish_folder_scan, folder, batch, scan_id)
+    
+    def add_scanned_files(self, paths, scan_id):
+        """Append files found by scan_folder, starting playback with the first one"""
+        if scan_id != self._folder_scan_id:
+            return
             
-            for root, _, filenames in os.walk(folder):
-                for filename in filenames:
-                    if filename.lower().endswith(SUPPORTED_FORMATS):
-                        files.append(os.path.join(root, filename))
+        start_playback = not self.playlist
+        self.add_to_playlist(paths)
+        if start_playback and self.playlist:
+            self.play(0)
+    
+    def finish_folder_scan(self, folder, paths, scan_id):
+        """Add the last files found by scan_folder and report the result"""
+        if scan_id != self._folder_scan_id:
+            return
             
-            if files:
-                self.add_to_playlist(files)
-                self.play(0)
-            else:
-                messagebox.showinfo("No Audio Files", "No supported audio files found in the selected folder.")
+        self.add_scanned_files(paths, scan_id)
+        if self.playlist:
+            self.status_left.config(text=f"Added {len(self.playlist)} songs from {os.path.basename(folder)}")
+        else:
+            messagebox.showinfo("No Audio Files", "No supported audio files found in the selected folder.")
     
     def add_to_playlist(self, file_paths):
         """Add files to the playlist"""
         new_songs = []
         
         for path in file_paths:
-            if not os.path.isfile(path):
+            if not _is_audio_name(path) or not os.path.isfile(path):
                 continue
                 
-            # Get basic info without loading all tags
-            try:
-                if path.lower().endswith('.mp3'):
-                    audio = mutagen.File(path, easy=True)
-                    length = audio.info.length
-                    title = audio.get('title', [os.path.basename(path)])[0]
-                    artist = audio.get('artist', ['Unknown Artist'])[0]
-                    album = audio.get('album', ['Unknown Album'])[0]
-                elif path.lower().endswith('.flac'):
-                    audio = FLAC(path)
-                    length = audio.info.length
-                    title = audio.get('title', [os.path.basename(path)])[0]
-                    artist = audio.get('artist', ['Unknown Artist'])[0]
-                    album = audio.get('album', ['Unknown Album'])[0]
-                elif path.lower().endswith('.ogg'):
-                    audio = OggVorbis(path)
-                    length = audio.info.length
-                    title = audio.get('title', [os.path.basename(path)])[0]
-                    artist = audio.get('artist', ['Unknown Artist'])[0]
-                    album = audio.get('album', ['Unknown Album'])[0]
-                elif path.lower().endswith('.wav'):
-                    with wave.open(path, 'rb') as wav_file:
-                        length = wav_file.getnframes() / float(wav_file.getframerate())
-                    title = os.path.basename(path)
-                    artist = 'Unknown Artist'
-                    album = 'Unknown Album'
-                else:
-                    # Unsupported format, skip
-                    continue
-                    
-                new_songs.append(Song(
-                    path=path,
-                    title=title,
-                    artist=artist,
-                    album=album,
-                    length=length
-                ))
-            except Exception as e:
-                print(f"Error loading file {path}: {e}")
-                continue
-        
+            # Tags are read lazily once the row is visible (see load_visible_tags)
+            new_songs.append(Song(
+                path=path,
+                title=os.path.basename(path),
+                artist='Unknown Artist',
+                album='Unknown Album',
+                length=0.0
+            ))
+        
+        self.append_songs(new_songs)
+    
+    def append_songs(self, new_songs):
+        """Append Song objects to the playlist and queue tag loading for any without tags"""
         if new_songs:
             start_index = len(self.playlist)
             self.playlist.extend(new_songs)
             
-            for i, song in enumerate(new_songs, start=start_index):
-                self.playlist_tree.insert('', 'end', values=(
-                    song.title,
-                    song.artist,
-                    self.format_time(song.length)
-                ))
+            # Build all rows up front and insert them in one tight loop, letting Tk
+            # lay out and redraw the tree once afterwards rather than between inserts
+            tree = self.playlist_tree
+            rows = [(song.title, song.artist, self.format_time(song.length)) for song in new_songs]
+            
+            # Selection is suspended during the bulk insert, and rows go straight to
+            # the Tcl insert command, skipping ttk's per-call option formatting
+            selectmode = tree.cget('selectmode')
+            tree.configure(selectmode='none')
+            iids = [tree.tk.call(tree._w, 'insert', '', 'end', '-values', row) for row in rows]
+            tree.configure(selectmode=selectmode)
+            self._iids.extend(iids)
+            self._iid_to_idx.update(zip(iids, range(start_index, len(self.playlist))))
+            self._shuffle_order.clear()
+            self.playlist_tree.update_idletasks()
             
             self.status_left.config(text=f"Added {len(new_songs)} songs to playlist")
+            
+            # Idle callbacks run in order, so visible rows are queued before the rest of the batch
+            self.schedule_visible_tags()
+            if len(new_songs) >= SCAN_PROCESS_THRESHOLD:
+                self.root.after_idle(self.load_tags_in_processes, list(zip(iids, new_songs)))
+            else:
+                self.root.after_idle(self.load_tags_async, list(zip(iids, new_songs)))
+    
+    def on_playlist_scroll(self, first, last):
+        """Update the scrollbar and load tags for rows scrolled into view"""
+        self.playlist_scrollbar.set(first, last)
+        self.schedule_visible_tags()
+    
+    def schedule_visible_tags(self):
+        """Coalesce visible-row tag loading into a single idle callback"""
+        if self._visible_tags_job is None:
+            self._visible_tags_job = self.root.after_idle(self.load_visible_tags)
+    
+    def load_visible_tags(self):
+        """Load tags in the background for the rows in the viewport and the selection"""
+        self._visible_tags_job = None
+        if not self._iids:
+            return
+            
+        # yview() gives the visible fraction of the list, which maps directly to row indices
+        first, last = self.playlist_tree.yview()
+        start = int(first * len(self._iids))
+        end = min(len(self._iids), int(last * len(self._iids)) + 1)
+        
+        rows = [(self._iids[i], self.playlist[i]) for i in range(start, end)]
+        rows.extend((iid, self.playlist[self._iid_to_idx[iid]]) for iid in self.playlist_tree.selection())
+        self.load_tags_async(rows, urgent=True)
+    
+    def load_tags_async(self, rows, urgent=False):
+        """Parse tags for (iid, song) pairs in the background, updating each row as it completes
+        
+        Urgent rows (now playing, on screen) go to the priority pool, even if they are
+        already queued behind bulk work on the tag pool or in a process batch.
+        """
+        pool, pending = (_priority_pool, self._tags_urgent) if urgent else (_tag_pool, self._tags_pending)
+        for iid, song in rows:
+            if song.tags_loaded or id(song) in pending:
+                continue
+                
+            pending.add(id(song))
+            future = pool.submit(self.load_song_tags, song, self._playlist_generation)
+            future.add_done_callback(
+                lambda f, iid=iid, song=song: self.root.after(0, self.on_tags_loaded, iid, song))
+    
+    def load_song_tags(self, song, generation):
+        """Parse one song's tags unless the playlist has been replaced since it was queued (runs on the tag pool)"""
+        if generation == self._playlist_generation:
+            song.load_tags(self.tag_cache)
+    
+    def load_tags_in_processes(self, rows):
+        """Parse tags for a large batch of (iid, song) pairs, sending cache misses to worker processes"""
+        rows = [(iid, song) for iid, song in rows
+                if not song.tags_loaded and id(song) not in self._tags_pending and id(song) not in self._tags_batched]
+        if not rows:
+            return
+            
+        try:
+            pool = _get_scan_pool()
+        except Exception as e:
+            print(f"Error starting tag scan processes: {e}")
+            self.load_tags_async(rows)
+            return
+            
+        self._tags_batched.update(id(song) for _, song in rows)
+        _tag_pool.submit(self.resolve_cached_tags, rows, pool, self._playlist_generation)
+    
+    def resolve_cached_tags(self, rows, pool, generation):
+        """Apply cached tags to rows and pass the misses back for the scan processes (runs on the tag pool)"""
+        misses = []
+        for iid, song in rows:
+            if generation != self._playlist_generation:
+                return
+                
+            try:
+                stat = os.stat(song.path)
+            except OSError:
+                stat = None
+                
+            cached = self.tag_cache.get(song.path, stat.st_mtime, stat.st_size) if stat is not None else None
+            if cached is not None:
+                song.apply_tags(*cached)
+                self.root.after(0, self.on_tags_loaded, iid, song)
+            else:
+                misses.append((iid, song, stat))
+                
+        if misses:
+            self.root.after(0, self.dispatch_scan_chunks, misses, pool, generation)
+    
+    def dispatch_scan_chunks(self, misses, pool, generation):
+        """Submit uncached rows to the scan processes a chunk at a time, so no thread waits on a whole batch"""
+        if generation != self._playlist_generation:
+            return
+            
+        # Rows removed while the cache pass ran don't need parsing
+        misses = [miss for miss in misses if miss[0] in self._iid_to_idx]
+        for start in range(0, len(misses), SCAN_CHUNK_SIZE):
+            chunk = misses[start:start + SCAN_CHUNK_SIZE]
+            try:
+                future = pool.submit(_scan_chunk, [song.path for _, song, _ in chunk])
+            except Exception as e:
+                # Fall back to the tag pool if the process pool is unavailable
+                print(f"Error scanning tags in worker processes: {e}")
+                self.load_tags_async([(iid, song) for iid, song, _ in misses[start:]])
+                return
+                
+            self._scan_futures.add(future)
+            future.add_done_callback(
+                lambda f, chunk=chunk: self.root.after(0, self.on_scan_chunk_done, chunk, f, generation))
+    
+    def on_scan_chunk_done(self, chunk, future, generation):
+        """Apply one chunk of tags parsed by the scan processes"""
+        self._scan_futures.discard(future)
+        if generation != self._playlist_generation or future.cancelled():
+            return
+            
+        try:
+            results = future.result()
+        except Exception as e:
+            print(f"Error scanning tags in worker processes: {e}")
+            self.load_tags_async([(iid, song) for iid, song, _ in chunk])
+            return
+            
+        for (iid, song, stat), (path, title, artist, album, length, parsed) in zip(chunk, results):
+            if not song.tags_loaded:  # a priority task may have read it first
+                song.apply_tags(title, artist, album, length)
+            if parsed and stat is not None:
+                self.tag_cache.put(path, stat.st_mtime, stat.st_size, title, artist, album, length)
+            self.on_tags_loaded(iid, song)
+    
+    def on_tags_loaded(self, iid, song):
+        """Show tags read by a background worker in the playlist"""
+        self._tags_pending.discard(id(song))
+        self._tags_urgent.discard(id(song))
+        self._tags_batched.discard(id(song))
+        if self.playlist_tree.exists(iid):
+            self.refresh_playlist_row(iid, song)
+            
+        if 0 <= self.current_index < len(self.playlist) and self.playlist[self.current_index] is song:
+            self.show_song_info(song)
+    
+    def refresh_playlist_row(self, iid, song):
+        """Update a playlist row from the song's current metadata"""
+        self.playlist_tree.item(iid, values=(
+            song.title,
+            song.artist,
+            self.format_time(song.length)
+        ))
+    
+    def reindex_playlist(self):
+        """Rebuild the item ID to playlist index lookup"""
+        self._iid_to_idx = {iid: i for i, iid in enumerate(self._iids)}
     
     def remove_selected(self):
         """Remove selected songs from the playlist"""
@@ -951,33 +1505,50 @@ class AudioPlayerApp:
         if not selection:
             return
             
-        # Get indices in reverse order to avoid shifting issues
-        indices = sorted([self.playlist_tree.index(item) for item in selection], reverse=True)
-        
-        for index in indices:
-            # Stop playback if removing currently playing song
-            if index == self.current_index:
-                self.stop()
-                self.current_index = -1
-                self.song_title.config(text="No song selected")
-                self.song_artist.config(text="")
-                self.song_album.config(text="")
-                self.time_total.config(text="0:00")
-            
-            # Remove from playlist
-            self.playlist.pop(index)
-            self.playlist_tree.delete(self.playlist_tree.get_children()[index])
-        
+        indices = sorted(self._iid_to_idx[item] for item in selection)
+        removed = set(indices)
+        
+        # Stop playback if removing currently playing song
+        if self.current_index in removed:
+            self.stop()
+            self.current_index = -1
+            self.song_title.config(text="No song selected")
+            self.song_artist.config(text="")
+            self.song_album.config(text="")
+            self.time_total.config(text="0:00")
+        elif self.current_index != -1:
+            self.current_index -= bisect.bisect_left(indices, self.current_index)
+        
+        # Remove from the treeview in one Tcl call and from the playlist in one pass
+        self.playlist_tree.delete(*selection)
+        self.playlist = [song for i, song in enumerate(self.playlist) if i not in removed]
+        self._iids = [iid for i, iid in enumerate(self._iids) if i not in removed]
+        
+        self.reindex_playlist()
+        self._shuffle_order.clear()
         self.status_left.config(text=f"Removed {len(indices)} songs from playlist")
     
     def clear_playlist(self):
         """Clear the entire playlist"""
+        # Abandon any folder scan and tag parsing still feeding the old playlist
+        self._folder_scan_id += 1
+        self._playlist_generation += 1
+        for future in self._scan_futures:
+            future.cancel()
+        self._scan_futures.clear()
+        
         if not self.playlist:
             return
             
         self.stop()
         self.playlist.clear()
-        self.playlist_tree.delete(*self.playlist_tree.get_children())
+        self.playlist_tree.delete(*self._iids)
+        self._iids.clear()
+        self._iid_to_idx.clear()
+        self._shuffle_order.clear()
+        self._tags_pending.clear()
+        self._tags_urgent.clear()
+        self._tags_batched.clear()
         self.current_index = -1
         self.song_title.config(text="No song selected")
         self.song_artist.config(text="")
@@ -987,61 +1558,45 @@ class AudioPlayerApp:
     
     def move_up(self):
         """Move selected songs up in the playlist"""
-        selection = self.playlist_tree.selection()
-        if not selection:
-            return
-            
-        indices = [self.playlist_tree.index(item) for item in selection]
-        if min(indices) == 0:
-            return  # Can't move up the first item
-            
-        for index in sorted(indices):
-            # Swap in playlist
-            self.playlist[index], self.playlist[index-1] = self.playlist[index-1], self.playlist[index]
-            
-            # Swap in treeview
-            prev_item = self.playlist_tree.get_children()[index-1]
-            item = self.playlist_tree.get_children()[index]
-            self.playlist_tree.move(item, '', index-1)
-            
-            # Update current index if needed
-            if index == self.current_index:
-                self.current_index -= 1
-            elif index-1 == self.current_index:
-                self.current_index += 1
-        
-        # Reselect items
-        for item in selection:
-            self.playlist_tree.selection_add(item)
+        self.move_selected(-1)
     
     def move_down(self):
         """Move selected songs down in the playlist"""
+        self.move_selected(1)
+    
+    def move_selected(self, step):
+        """Shift the selected songs one row up (step -1) or down (step 1)"""
         selection = self.playlist_tree.selection()
         if not selection:
             return
             
-        indices = [self.playlist_tree.index(item) for item in selection]
-        if max(indices) == len(self.playlist) - 1:
-            return  # Can't move down the last item
-            
-        for index in sorted(indices, reverse=True):
-            # Swap in playlist
-            self.playlist[index], self.playlist[index+1] = self.playlist[index+1], self.playlist[index]
+        indices = sorted(self._iid_to_idx[item] for item in selection)
+        if indices[0] + step < 0 or indices[-1] + step >= len(self.playlist):
+            return  # Can't move past the first or last item
             
-            # Swap in treeview
-            next_item = self.playlist_tree.get_children()[index+1]
-            item = self.playlist_tree.get_children()[index]
-            self.playlist_tree.move(item, '', index+1)
+        # Swap neighbours in the Python lists first, nearest the edge being moved toward first
+        for index in (indices if step < 0 else reversed(indices)):
+            other = index + step
+            self.playlist[index], self.playlist[other] = self.playlist[other], self.playlist[index]
+            self._iids[index], self._iids[other] = self._iids[other], self._iids[index]
             
             # Update current index if needed
             if index == self.current_index:
-                self.current_index += 1
-            elif index+1 == self.current_index:
-                self.current_index -= 1
+                self.current_index = other
+            elif other == self.current_index:
+                self.current_index = index
+                
+        # Then put the tree rows in place, touching only positions that changed
+        changed = sorted(set(indices).union(index + step for index in indices))
+        for pos in changed:
+            iid = self._iids[pos]
+            self.playlist_tree.move(iid, '', pos)
+            self._iid_to_idx[iid] = pos
+        
+        self._shuffle_order.clear()
         
         # Reselect items
-        for item in selection:
-            self.playlist_tree.selection_add(item)
+        self.playlist_tree.selection_set(selection)
     
     def save_playlist(self):
         """Save the current playlist to a file"""
@@ -1057,18 +1612,20 @@ class AudioPlayerApp:
         
         if file:
             try:
-                playlist_data = []
-                for song in self.playlist:
-                    playlist_data.append({
-                        'path': song.path,
-                        'title': song.title,
-                        'artist': song.artist,
-                        'album': song.album,
-                        'length': song.length
-                    })
-                
+                # Stream one compact object per line instead of building and pretty-printing the whole list
                 with open(file, 'w') as f:
-                    json.dump(playlist_data, f, indent=2)
+                    f.write('[\n')
+                    for i, song in enumerate(self.playlist):
+                        if i:
+                            f.write(',\n')
+                        f.write(json.dumps({
+                            'path': song.path,
+                            'title': song.title,
+                            'artist': song.artist,
+                            'album': song.album,
+                            'length': song.length
+                        }))
+                    f.write('\n]\n')
                 
                 self.status_left.config(text=f"Playlist saved to {os.path.basename(file)}")
             except Exception as e:
@@ -1098,17 +1655,22 @@ class AudioPlayerApp:
                         else:
                             continue
                     
-                    new_songs.append(Song(
+                    song = Song(
                         path=item['path'],
                         title=item.get('title', os.path.basename(item['path'])),
                         artist=item.get('artist', 'Unknown Artist'),
                         album=item.get('album', 'Unknown Album'),
                         length=item.get('length', 0)
-                    ))
+                    )
+                    
+                    # A saved length means the tags were read before saving, so don't parse the file again
+                    if song.length > 0:
+                        song.apply_tags(song.title, song.artist, song.album, song.length)
+                    new_songs.append(song)
                 
                 if new_songs:
                     self.clear_playlist()
-                    self.add_to_playlist([song.path for song in new_songs])
+                    self.append_songs(new_songs)
                     self.status_left.config(text=f"Loaded playlist {os.path.basename(file)}")
                 else:
                     messagebox.showwarning("Empty Playlist", "No valid songs found in the playlist file.")
@@ -1128,7 +1690,7 @@ class AudioPlayerApp:
         if not selection:
             return
             
-        index = self.playlist_tree.index(selection[0])
+        index = self._iid_to_idx[selection[0]]
         song = self.playlist[index]
         
         try:
@@ -1147,9 +1709,9 @@ class AudioPlayerApp:
         if not selection:
             return
             
-        index = self.playlist_tree.index(selection[0])
+        index = self._iid_to_idx[selection[0]]
         song = self.playlist[index]
-        song.load_tags()
+        song.load_tags(self.tag_cache)
         
         properties = [
             f"Title: {song.title}",
@@ -1176,8 +1738,13 @@ class AudioPlayerApp:
     def on_equalizer_change(self, band_idx, value):
         """Handle equalizer band change"""
         self.equalizer_bands[band_idx] = value
+        self.update_equalizer_gains()
         self.apply_equalizer()
     
+    def update_equalizer_gains(self):
+        """Convert the band settings from dB to linear gains, once per change rather than per apply"""
+        self.equalizer_gains = 10 ** (np.asarray(self.equalizer_bands, dtype=np.float32) / 20)
+    
     def apply_equalizer(self):
         """Apply equalizer settings to current playback"""
         if not mixer.music.get_busy() or self.current_index == -1:
@@ -1187,60 +1754,84 @@ class AudioPlayerApp:
         # A real implementation would use a proper audio processing library
         # For demonstration, we'll just adjust the volume of different frequency ranges
         
-        # Calculate band gains (convert from dB to multiplier)
-        band_gains = [10 ** (band / 20) for band in self.equalizer_bands]
-        
         # Apply to playback (this is where you'd normally use a proper DSP)
-        # For this demo, we'll just print the gains
-        print(f"Applying equalizer gains: {band_gains}")
+        # For this demo, we'll just print the gains precomputed by update_equalizer_gains
+        print(f"Applying equalizer gains: {self.equalizer_gains.tolist()}")
     
     # Visualization functionality
-    def update_visualization(self):
-        """Update the audio visualization"""
-        while self.visualization_thread_running:
-            if mixer.music.get_busy() and not self.paused:
-                # Simulate getting audio data (in a real app, you'd use a proper audio analysis)
-                # Here we just generate some random data for visualization
-                new_data = np.random.rand(1) * 100
-                self.visualization_data.append(new_data[0])
-                
-                # Update the visualization on the main thread
-                self.root.after(0, self.draw_visualization)
+    def visualization_tick(self):
+        """Advance and redraw the audio visualization"""
+        if not self._vis_active:
+            # Nothing is on screen while the window is in the tray, so just check back less often
+            self.root.after(200, self.visualization_tick)
+            return
             
-            time.sleep(0.05)
+        if mixer.music.get_busy() and not self.paused:
+            # Simulate getting audio data (in a real app, you'd use a proper audio analysis)
+            # Here we just generate some random data for visualization, a batch at a time
+            if self._viz_noise_pos == VISUALIZATION_SAMPLES:
+                self._viz_noise = np.random.rand(VISUALIZATION_SAMPLES).astype(np.float32) * 100
+                self._viz_noise_pos = 0
+            self._viz_buf[self._viz_head] = self._viz_noise[self._viz_noise_pos]
+            self._viz_noise_pos += 1
+            self._viz_head = (self._viz_head + 1) % VISUALIZATION_SAMPLES
+            
+            width, height = self.visualization_size
+            if width > 1 and height > 1:
+                self.render_visualization(width, height)
+                self.draw_visualization()
+                
+        self.root.after(50, self.visualization_tick)
+    
+    def on_visualization_resize(self, event):
+        """Record the canvas size for the next visualization frame"""
+        self.visualization_size = (event.width, event.height)
+    
+    def update_visualization_background(self):
+        """Cache the canvas background as an RGB triple for frame rendering"""
+        self.visualization_bg = np.array(
+            [c >> 8 for c in self.visualization_canvas.winfo_rgb(self.visualization_canvas.cget('bg'))],
+            dtype=np.uint8
+        )
+    
+    def visualization_layout(self, width, height):
+        """Return the per-column bar mapping for a canvas size, rebuilt only when the size changes"""
+        if self._viz_layout_size != (width, height):
+            # Map every pixel column to its bar, keeping the last column of each bar as a gap
+            bar_width = width / VISUALIZATION_SAMPLES
+            columns = np.arange(width)
+            bars = np.minimum((columns / bar_width).astype(np.int32), VISUALIZATION_SAMPLES - 1)
+            solid = ~(columns - bars * bar_width >= bar_width - 1)
+            rows = np.arange(height)[:, None]
+            self._viz_layout = (bars, solid[None, :], rows)
+            self._viz_layout_size = (width, height)
+            self._viz_frame = np.zeros((height, width, 3), dtype=np.uint8)  # rendered into in place
+        return self._viz_layout
+    
+    def render_visualization(self, width, height):
+        """Render the visualization bars into the preallocated RGB frame (no Tk calls)"""
+        bars, solid, rows = self.visualization_layout(width, height)
+        
+        # Read the ring with the oldest sample on the left, without unrolling it first
+        values = self._viz_buf[(bars + self._viz_head) % VISUALIZATION_SAMPLES]
+        tops = height - values * (height / 100)
+        colors = _VIS_COLOR_LUT[values.astype(np.intp)]
+        
+        filled = (rows >= tops[None, :]) & solid
+        frame = self._viz_frame
+        frame[:] = self.visualization_bg
+        np.copyto(frame, colors[None, :, :], where=filled[:, :, None])
     
     def draw_visualization(self):
-        """Draw the audio visualization"""
-        self.visualization_canvas.delete("all")
+        """Draw the most recently rendered visualization frame"""
+        width, height = self._viz_layout_size
         
-        width = self.visualization_canvas.winfo_width()
-        height = self.visualization_canvas.winfo_height()
-        
-        if width <= 1 or height <= 1:
-            return
-            
-        # Draw a simple bar visualization
-        bar_width = width / VISUALIZATION_SAMPLES
-        data = list(self.visualization_data)
-        
-        for i, value in enumerate(data):
-            x0 = i * bar_width
-            x1 = x0 + bar_width - 1
-            y0 = height - (value / 100 * height)
-            y1 = height
+        if self.visualization_photo is None or (self.visualization_photo.width(), self.visualization_photo.height()) != (width, height):
+            self.visualization_photo = ImageTk.PhotoImage('RGB', (width, height))
+            self.visualization_canvas.itemconfig(self.visualization_image, image=self.visualization_photo)
             
-            color = "#{:02x}{:02x}{:02x}".format(
-                int(255 * (value / 100)),
-                int(128 + (value / 100 * 127)),
-                128
-            )
-            
-            self.visualization_canvas.create_rectangle(
-                x0, y0, x1, y1,
-                fill=color,
-                outline=color,
-                width=0
-            )
+        # Push the whole frame to Tk in a single paste
+        self.visualization_photo.paste(Image.fromarray(self._viz_frame))
     
     # Theme and appearance
     def toggle_dark_mode(self):
@@ -1278,6 +1869,7 @@ class AudioPlayerApp:
         # Progress bar
         self.mini_progress = ttk.Scale(controls_frame, from_=0, to=100, orient=tk.HORIZONTAL)
         self.mini_progress.pack(fill=tk.X, pady=2)
+        self._mini_last = (None, None)  # (label text, progress) last shown, so unchanged ticks skip Tk
         
         # Buttons
         btn_frame = ttk.Frame(controls_frame)
@@ -1297,26 +1889,38 @@ class AudioPlayerApp:
     def update_mini_player(self):
         """Update the mini player display"""
         if hasattr(self, 'mini_player') and self.mini_player.winfo_exists():
-            if self.current_index != -1 and self.playlist:
+            # Skip the widget updates while the mini player is minimized
+            if self.current_index != -1 and self.playlist and self.mini_player.winfo_viewable():
                 song = self.playlist[self.current_index]
-                self.mini_song_label.config(text=f"{song.title} - {song.artist}")
+                text = f"{song.title} - {song.artist}"
+                last_text, last_progress = self._mini_last
                 
-                if mixer.music.get_busy() and not self.paused:
+                # Only touch the widgets when what they show has changed
+                if text != last_text:
+                    self.mini_song_label.config(text=text)
+                    
+                progress = last_progress
+                if mixer.music.get_busy() and not self.paused and song.length:
                     current_pos = mixer.music.get_pos() / 1000
-                    progress = (current_pos / song.length) * 100
-                    self.mini_progress.set(progress)
+                    progress = round((current_pos / song.length) * 100, 1)
+                    if progress != last_progress:
+                        self.mini_progress.set(progress)
+                        
+                self._mini_last = (text, progress)
             
             self.root.after(1000, self.update_mini_player)
     
     # System tray functionality
     def show_window(self):
         """Show the main window from system tray"""
+        self._vis_active = True
         self.root.deiconify()
         self.root.attributes('-topmost', True)
         self.root.after(100, lambda: self.root.attributes('-topmost', False))
     
     def hide_window(self):
         """Hide the main window to system tray"""
+        self._vis_active = False
         self.root.withdraw()
     
     # Configuration
@@ -1363,11 +1967,41 @@ class AudioPlayerApp:
         """Show documentation in browser"""
         webbrowser.open("https://github.com/yourusername/audio-player/docs")
     
-    def check_for_updates(self):
-        """Check for updates"""
+    def check_for_updates(self, force=True):
+        """Check for updates, reusing a result from the last day unless forced"""
+        if not force:
+            try:
+                with open(UPDATE_CHECK_FILE, 'r') as f:
+                    cached = json.load(f)
+                    
+                if time.time() - cached.get('checked_at', 0) < UPDATE_CHECK_INTERVAL:
+                    if cached.get('version', APP_VERSION) != APP_VERSION:
+                        self.status_left.config(text=f"Version {cached['version']} is available")
+                    return
+            except (OSError, ValueError, AttributeError):
+                pass  # No usable result, check now
+                
         self.status_left.config(text="Checking for updates...")
-        # In a real app, this would check your update server
-        self.root.after(2000, lambda: self.status_left.config(text="You have the latest version"))
+        threading.Thread(target=self.fetch_latest_version, daemon=True).start()
+    
+    def fetch_latest_version(self):
+        """Look up the latest version off the Tk thread and cache the result"""
+        try:
+            # In a real app, this would query your update server
+            latest = APP_VERSION
+            
+            with open(UPDATE_CHECK_FILE, 'w') as f:
+                json.dump({'version': latest, 'checked_at': time.time()}, f)
+        except Exception as e:
+            print(f"Error checking for updates: {e}")
+            self.root.after(0, lambda: self.status_left.config(text="Ready"))
+            return
+            
+        if latest == APP_VERSION:
+            message = "You have the latest version"
+        else:
+            message = f"Version {latest} is available"
+        self.root.after(0, lambda: self.status_left.config(text=message))
     
     def show_about(self):
         """Show about dialog"""
@@ -1389,11 +2023,12 @@ A feature-rich audio player with:
     # Application lifecycle
     def quit_app(self):
         """Quit the application"""
-        self.visualization_thread_running = False
-        if self.visualization_thread.is_alive():
-            self.visualization_thread.join(timeout=0.1)
-        
         self.save_config()
+        _tag_pool.shutdown(wait=False, cancel_futures=True)
+        _priority_pool.shutdown(wait=False, cancel_futures=True)
+        if _scan_pool is not None:
+            _scan_pool.shutdown(wait=False, cancel_futures=True)
+        self.tag_cache.close()
         mixer.quit()
         
         if hasattr(self, 'tray_icon'):
@@ -1404,6 +2039,9 @@ A feature-rich audio player with:
 
 def main():
     """Main entry point"""
+    # Hand the GIL back to the Tk thread quickly when worker threads are busy
+    sys.setswitchinterval(0.001)
+    
     root = tk.Tk()
     
     # Set window icon